@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import generate_developer_report as report
+
+# File names generate_summary_stats() reads from the working directory
+PR_FILE = "merged_prs_since_2025-01-01.csv"
+COMMENT_FILE = "pr_comments_since_2025-01-01.csv"
+
+REPOSITORIES = ['FSP-V4', 'FSP-Mobile', 'FSP-API', 'FSP-Infrastructure', 'FSP-Web']
+COMMENT_TYPES = ['issue_comment', 'review', 'review_comment']
+BOT_AUTHORS = ['dependabot[bot]', 'github-actions[bot]', 'app/github-actions']
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+def generate_synthetic_data(output_dir, developers, prs, comments, years, seed):
+    """Write synthetic merged PR and PR comment CSVs matching github_combined_stats.sh output"""
+    print(f"Generating {prs:,} PRs and {comments:,} comments for {developers:,} developers over {years} years...")
+    rng = np.random.default_rng(seed)
+
+    end = pd.Timestamp.now(tz='UTC').floor('s').tz_localize(None)
+    start = end - pd.DateOffset(years=years)
+    span_seconds = int((end - start).total_seconds())
+
+    # Skew activity so a handful of developers dominate, like a real org
+    authors = np.array([f"developer-{i:04d}" for i in range(developers)])
+    author_weights = rng.zipf(1.5, size=developers).astype(float)
+    author_weights /= author_weights.sum()
+
+    # PRs
+    pr_authors = rng.choice(authors, size=prs, p=author_weights)
+    created_at = start + pd.to_timedelta(rng.integers(0, span_seconds, size=prs), unit='s')
+    merged_at = created_at + pd.to_timedelta(rng.exponential(2 * 86400, size=prs).astype(int), unit='s')
+    merged_at = merged_at.where(merged_at <= end, end)
+    lines_added = rng.lognormal(4, 1.5, size=prs).astype(int)
+    lines_deleted = rng.lognormal(3, 1.5, size=prs).astype(int)
+    pr_numbers = np.arange(1, prs + 1)
+    pr_titles = np.char.add('Synthetic change ', pr_numbers.astype(str))
+
+    pr_df = pd.DataFrame({
+        'repository': rng.choice(REPOSITORIES, size=prs),
+        'pr_number': pr_numbers,
+        'author': pr_authors,
+        'title': pr_titles,
+        'created_at': created_at.strftime(TIMESTAMP_FORMAT),
+        'merged_at': merged_at.strftime(TIMESTAMP_FORMAT),
+        'base_branch': 'main',
+        'lines_added': lines_added,
+        'lines_deleted': lines_deleted,
+        'total_lines_changed': lines_added + lines_deleted,
+        'files_changed': rng.integers(1, 60, size=prs)
+    })
+    pr_df.to_csv(Path(output_dir) / PR_FILE, index=False)
+
+    # Comments - attach each to a PR and land it between PR creation and merge
+    comment_pr = rng.integers(0, prs, size=comments)
+    comment_authors = rng.choice(authors, size=comments, p=author_weights)
+    is_bot = rng.random(size=comments) < 0.05
+    comment_authors[is_bot] = rng.choice(BOT_AUTHORS, size=is_bot.sum())
+    pr_open_seconds = (merged_at - created_at).total_seconds().to_numpy()[comment_pr]
+    comment_created_at = created_at[comment_pr] + pd.to_timedelta((rng.random(size=comments) * pr_open_seconds).astype(int), unit='s')
+
+    comment_df = pd.DataFrame({
+        'repository': pr_df['repository'].to_numpy()[comment_pr],
+        'pr_number': pr_numbers[comment_pr],
+        'comment_id': np.arange(1, comments + 1) + 2_000_000_000,
+        'comment_type': rng.choice(COMMENT_TYPES, size=comments),
+        'comment_author': comment_authors,
+        'comment_body': 'Synthetic review comment',
+        'comment_created_at': comment_created_at.strftime(TIMESTAMP_FORMAT),
+        'comment_updated_at': comment_created_at.strftime(TIMESTAMP_FORMAT),
+        'pr_author': pr_authors[comment_pr],
+        'pr_title': pr_titles[comment_pr]
+    })
+    comment_df.to_csv(Path(output_dir) / COMMENT_FILE, index=False)
+
+    return start.strftime('%Y-%m-%d')
+
+def run_stage(results, name, func, *args, quiet=True, measure_memory=True, **kwargs):
+    """Run one report stage, recording wall time and peak traced memory"""
+    print(f"Running {name}...")
+    output = io.StringIO() if quiet else sys.stdout
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        value = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    results[name] = {'seconds': round(elapsed, 4)}
+
+    # tracemalloc slows allocation-heavy code several times over, so memory gets its own run
+    if measure_memory:
+        tracemalloc.start()
+        with contextlib.redirect_stdout(output):
+            func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name]['peak_memory_mb'] = round(peak / (1024 * 1024), 2)
+        print(f"  {elapsed:.2f}s, peak {peak / (1024 * 1024):.1f} MB")
+    else:
+        print(f"  {elapsed:.2f}s")
+
+    return value
+
+def calculate_rolling_averages(pr_complete, comment_complete, authors):
+    """Run the team and per-developer rolling computations used by plot_developer_trends"""
+    report.calculate_team_averages(pr_complete, comment_complete)
+    for author in authors:
+        report.calculate_developer_averages(pr_complete, comment_complete, author)
+
+def git_commit():
+    """Return the current git commit so results can be tied to a version"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare_to_baseline(results, baseline_file):
+    """Print the change in time and memory for each stage against a previous results file"""
+    with open(baseline_file) as f:
+        baseline = json.load(f)
+
+    print("\n" + "="*72)
+    print(f"COMPARISON TO BASELINE ({baseline.get('git_commit') or baseline_file})")
+    print("="*72)
+    print(f"{'Stage':<32} {'Seconds':<20} {'Peak MB':<20}")
+    print("-"*72)
+
+    for name, stage in results['stages'].items():
+        base = baseline.get('stages', {}).get(name)
+        if not base:
+            print(f"{name:<32} {'(no baseline)':<20}")
+            continue
+        time_change = (stage['seconds'] - base['seconds']) / base['seconds'] * 100 if base['seconds'] else 0
+        line = f"{name:<32} {stage['seconds']:<8.2f} ({time_change:+6.1f}%)   "
+        if 'peak_memory_mb' in stage and base.get('peak_memory_mb'):
+            memory_change = (stage['peak_memory_mb'] - base['peak_memory_mb']) / base['peak_memory_mb'] * 100
+            line += f"{stage['peak_memory_mb']:<8.1f} ({memory_change:+6.1f}%)"
+        print(line)
+
+def main():
+    """Generate a synthetic org, time each report stage, and save the results as JSON"""
+    parser = argparse.ArgumentParser(description="Benchmark the developer productivity report on synthetic data")
+    parser.add_argument('--developers', type=int, default=500, help="Number of synthetic developers")
+    parser.add_argument('--prs', type=int, default=100_000, help="Number of synthetic merged PRs")
+    parser.add_argument('--comments', type=int, default=1_000_000, help="Number of synthetic PR comments")
+    parser.add_argument('--years', type=int, default=3, help="Years of history to spread activity over")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed for reproducible data")
+    parser.add_argument('--output', default=None, help="Results JSON file (default: benchmark_results_<timestamp>.json)")
+    parser.add_argument('--baseline', default=None, help="Previous results JSON file to compare against")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the second, memory-traced run of each stage")
+    parser.add_argument('--verbose', action='store_true', help="Show the report's own output for each stage")
+    args = parser.parse_args()
+
+    output_file = Path(args.output or f"benchmark_results_{datetime.now():%Y%m%d_%H%M%S}.json").resolve()
+    baseline_file = Path(args.baseline).resolve() if args.baseline else None
+    quiet = not args.verbose
+    measure_memory = not args.no_memory
+    stages = {}
+
+    # generate_summary_stats() and plot_developer_trends() work against the current directory
+    original_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        try:
+            start_date = generate_synthetic_data(work_dir, args.developers, args.prs, args.comments, args.years, args.seed)
+
+            pr_data = run_stage(stages, 'load_and_process_pr_data', report.load_and_process_pr_data, PR_FILE, quiet=quiet, measure_memory=measure_memory)
+            comment_data = run_stage(stages, 'load_and_process_comment_data', report.load_and_process_comment_data, COMMENT_FILE, quiet=quiet, measure_memory=measure_memory)
+
+            # Same developer selection as plot_developer_trends
+            top_developers = pr_data.groupby('author')['pr_count'].sum().nlargest(10).index.tolist()
+            date_range = report.create_complete_date_range(start_date)
+
+            pr_complete = run_stage(stages, 'fill_missing_dates', report.fill_missing_dates, pr_data, date_range, top_developers, quiet=quiet, measure_memory=measure_memory)
+            comment_complete = report.fill_missing_dates(comment_data, date_range, top_developers)
+
+            run_stage(stages, 'rolling_averages', calculate_rolling_averages, pr_complete, comment_complete, top_developers, quiet=quiet, measure_memory=measure_memory)
+            run_stage(stages, 'plot_developer_trends', report.plot_developer_trends, pr_data, comment_data, start_date=start_date, quiet=quiet, measure_memory=measure_memory)
+            run_stage(stages, 'generate_summary_stats', report.generate_summary_stats, pr_data, comment_data, quiet=quiet, measure_memory=measure_memory)
+        finally:
+            os.chdir(original_dir)
+
+    # ru_maxrss is reported in kilobytes on Linux and bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    max_rss_mb = max_rss / (1024 * 1024) if sys.platform == 'darwin' else max_rss / 1024
+
+    results = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': git_commit(),
+        'config': {
+            'developers': args.developers,
+            'prs': args.prs,
+            'comments': args.comments,
+            'years': args.years,
+            'seed': args.seed
+        },
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'matplotlib': matplotlib.__version__
+        },
+        'stages': stages,
+        'total_seconds': round(sum(stage['seconds'] for stage in stages.values()), 4),
+        'process_max_rss_mb': round(max_rss_mb, 2)
+    }
+
+    with open(output_file, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nBenchmark results saved as {output_file}")
+
+    if baseline_file:
+        compare_to_baseline(results, baseline_file)
+
+if __name__ == "__main__":
+    main()
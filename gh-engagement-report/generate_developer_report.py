@@ -110,7 +110,40 @@ def fill_missing_dates(df, date_range, authors):
     merged = complete_df.merge(df, on=['author', 'date'], how='left').fillna(0)
     return merged
 
-def plot_developer_trends(pr_data, comment_data, output_file='developer_productivity_report.png'):
+def calculate_team_averages(pr_complete, comment_complete):
+    """Calculate daily team averages with 14-day rolling averages for smoothing"""
+    # PR averages
+    pr_daily_avg = pr_complete.groupby('date').agg({
+        'pr_count': 'mean',
+        'avg_lines_per_pr': 'mean'
+    }).reset_index()
+    pr_daily_avg['pr_count_ma'] = pr_daily_avg['pr_count'].rolling(window=14, center=True, min_periods=3).mean()  # 14-day rolling average
+    pr_daily_avg['avg_lines_ma'] = pr_daily_avg['avg_lines_per_pr'].rolling(window=14, center=True, min_periods=3).mean()
+    
+    # Comment averages (if we have comment data)
+    if not comment_complete.empty:
+        comment_daily_avg = comment_complete.groupby('date')['comment_count'].mean().reset_index()
+        comment_daily_avg['comment_count_ma'] = comment_daily_avg['comment_count'].rolling(window=14, center=True, min_periods=3).mean()
+    else:
+        comment_daily_avg = pd.DataFrame()
+    
+    return pr_daily_avg, comment_daily_avg
+
+def calculate_developer_averages(pr_complete, comment_complete, author):
+    """Calculate a single developer's daily data with 21-day rolling averages for smoothing"""
+    author_pr_data = pr_complete[pr_complete['author'] == author].sort_values('date')
+    author_pr_data['pr_count_ma'] = author_pr_data['pr_count'].rolling(window=21, center=True, min_periods=3).mean()  # 21-day rolling average
+    author_pr_data['avg_lines_ma'] = author_pr_data['avg_lines_per_pr'].rolling(window=21, center=True, min_periods=3).mean()
+    
+    if not comment_complete.empty:
+        author_comment_data = comment_complete[comment_complete['author'] == author].sort_values('date')
+        author_comment_data['comment_count_ma'] = author_comment_data['comment_count'].rolling(window=21, center=True, min_periods=3).mean()
+    else:
+        author_comment_data = pd.DataFrame()
+    
+    return author_pr_data, author_comment_data
+
+def plot_developer_trends(pr_data, comment_data, output_file='developer_productivity_report.png', start_date='2025-01-01'):
     """Create individual developer productivity visualizations vs team averages"""
     
     # Get all unique developers from both datasets
@@ -129,7 +162,7 @@ def plot_developer_trends(pr_data, comment_data, output_file='developer_producti
     print(f"Creating combined report for {len(all_authors)} developers...")
     
     # Create date range
-    date_range = create_complete_date_range()
+    date_range = create_complete_date_range(start_date)
     
     # Fill missing dates for both datasets
     pr_complete = fill_missing_dates(pr_data, date_range, all_authors)
@@ -137,21 +170,7 @@ def plot_developer_trends(pr_data, comment_data, output_file='developer_producti
     
     # Calculate team averages with longer rolling windows for smoothing
     print("Calculating team averages...")
-    
-    # PR averages
-    pr_daily_avg = pr_complete.groupby('date').agg({
-        'pr_count': 'mean',
-        'avg_lines_per_pr': 'mean'
-    }).reset_index()
-    pr_daily_avg['pr_count_ma'] = pr_daily_avg['pr_count'].rolling(window=14, center=True, min_periods=3).mean()  # 14-day rolling average
-    pr_daily_avg['avg_lines_ma'] = pr_daily_avg['avg_lines_per_pr'].rolling(window=14, center=True, min_periods=3).mean()
-    
-    # Comment averages (if we have comment data)
-    if not comment_complete.empty:
-        comment_daily_avg = comment_complete.groupby('date')['comment_count'].mean().reset_index()
-        comment_daily_avg['comment_count_ma'] = comment_daily_avg['comment_count'].rolling(window=14, center=True, min_periods=3).mean()
-    else:
-        comment_daily_avg = pd.DataFrame()
+    pr_daily_avg, comment_daily_avg = calculate_team_averages(pr_complete, comment_complete)
     
     # Create combined report with all developers
     num_devs = len(all_authors)
@@ -175,15 +194,7 @@ def plot_developer_trends(pr_data, comment_data, output_file='developer_producti
         row = i
         
         # Get this developer's data with longer rolling windows for smoothing
-        author_pr_data = pr_complete[pr_complete['author'] == author].sort_values('date')
-        author_pr_data['pr_count_ma'] = author_pr_data['pr_count'].rolling(window=21, center=True, min_periods=3).mean()  # 21-day rolling average
-        author_pr_data['avg_lines_ma'] = author_pr_data['avg_lines_per_pr'].rolling(window=21, center=True, min_periods=3).mean()
-        
-        if not comment_complete.empty:
-            author_comment_data = comment_complete[comment_complete['author'] == author].sort_values('date')
-            author_comment_data['comment_count_ma'] = author_comment_data['comment_count'].rolling(window=21, center=True, min_periods=3).mean()
-        else:
-            author_comment_data = pd.DataFrame()
+        author_pr_data, author_comment_data = calculate_developer_averages(pr_complete, comment_complete, author)
         
         # Plot 1: PRs per day vs team average (Column 0)
         ax1 = axes[row, 0]
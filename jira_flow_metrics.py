@@ -0,0 +1,430 @@
+import json
+import math
+from collections import Counter
+import pandas as pd
+
+# Flow metric definitions - metric name -> (start date field, end date field)
+# Lead Time: Created until Done
+    # Cycle Time: Development Start until Done
+        # Development Time: Development Start until Product Acceptance
+        # Dev Validation Time: Product Acceptance start until QA Start
+        # QA Validation Time: QA start until Done
+FLOW_DURATION_METRICS = {
+    'Lead Time (days)': ('Created Date', 'Done Date'),
+    'Cycle Time (days)': ('Development Date', 'Done Date'),
+    'CT Development Time (days)': ('Development Date', 'Dev Validation Date'),
+    'CT Dev Validation Time (days)': ('Dev Validation Date', 'QA Validation Date'),
+    'CT QA Validation Time (days)': ('QA Validation Date', 'Done Date'),
+}
+
+# Throughput metrics - metric name -> week field the issue is counted in
+FLOW_THROUGHPUT_METRICS = {
+    'Created Count': 'Created Week',
+    'Resolved Count': 'Resolution Week',
+}
+
+# Issue fields the store keeps per issue so a later change can be backed out of the weeks it used to touch
+FLOW_ISSUE_FIELDS = ['Issue Type Category', 'Created Week', 'Resolution Week', 'Created Date', 'Development Date',
+                     'Dev Validation Date', 'QA Validation Date', 'Done Date']
+FLOW_DATE_FIELDS = [field for field in FLOW_ISSUE_FIELDS if field != 'Issue Type Category']
+
+DEFAULT_SKETCH_RELATIVE_ACCURACY = 0.01
+
+
+# class QuantileSketch # MERGEABLE APPROXIMATE QUANTILES WITH A FIXED RELATIVE ERROR
+class QuantileSketch:
+    """
+    Log-bucketed quantile sketch (DDSketch style) for duration values.
+
+    Every value lands in a bucket whose bounds are within `relative_accuracy` of it, so quantile estimates carry
+    the same relative error regardless of how many values were added. Buckets are plain counts, which means two
+    sketches can be merged by adding counts and a value can be removed again by decrementing - the latter is
+    what lets the aggregate store back out an issue's old durations when its stage dates change.
+    """
+
+    def __init__(self, relative_accuracy=DEFAULT_SKETCH_RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.positive = Counter()
+        self.negative = Counter()  # stage dates can go backwards, so keep negative durations too
+        self.zero_count = 0
+        self.count = 0
+
+    def _bucket(self, value):
+        return math.ceil(math.log(abs(value)) / self.log_gamma)
+
+    def _bucket_value(self, bucket):
+        return 2 * self.gamma ** bucket / (self.gamma + 1)
+
+    def add(self, value, count=1):
+        if value > 0:
+            self.positive[self._bucket(value)] += count
+        elif value < 0:
+            self.negative[self._bucket(value)] += count
+        else:
+            self.zero_count += count
+        self.count += count
+
+    def remove(self, value, count=1):
+        buckets = self.positive if value > 0 else self.negative if value < 0 else None
+        if buckets is None:
+            self.zero_count -= count
+        else:
+            bucket = self._bucket(value)
+            buckets[bucket] -= count
+            if buckets[bucket] <= 0:
+                del buckets[bucket]
+        self.count -= count
+
+    def merge(self, other):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge quantile sketches with different relative accuracy")
+        self.positive.update(other.positive)
+        self.negative.update(other.negative)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        return self
+
+    def quantile(self, q):
+        if self.count <= 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        # Walk the values in ascending order: most negative, zero, then positive
+        for bucket in sorted(self.negative, reverse=True):
+            seen += self.negative[bucket]
+            if seen > rank:
+                return -self._bucket_value(bucket)
+
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+
+        for bucket in sorted(self.positive):
+            seen += self.positive[bucket]
+            if seen > rank:
+                return self._bucket_value(bucket)
+
+        return self._bucket_value(max(self.positive)) if self.positive else 0.0
+
+    def to_dict(self):
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'positive': {str(bucket): count for bucket, count in self.positive.items()},
+            'negative': {str(bucket): count for bucket, count in self.negative.items()},
+            'zero_count': self.zero_count,
+            'count': self.count
+        }
+
+    @classmethod
+    def from_dict(cls, values):
+        sketch = cls(values['relative_accuracy'])
+        sketch.positive = Counter({int(bucket): count for bucket, count in values['positive'].items()})
+        sketch.negative = Counter({int(bucket): count for bucket, count in values['negative'].items()})
+        sketch.zero_count = values['zero_count']
+        sketch.count = values['count']
+        return sketch
+
+
+# class FlowAggregate # COUNT, SUM, AND QUANTILE SKETCH FOR ONE METRIC IN ONE WEEK
+class FlowAggregate:
+    """Running count, sum, and (for durations) quantile sketch for a single team / week / category / metric."""
+
+    def __init__(self, with_sketch=True, relative_accuracy=DEFAULT_SKETCH_RELATIVE_ACCURACY):
+        self.count = 0
+        self.total = 0.0
+        self.sketch = QuantileSketch(relative_accuracy) if with_sketch else None
+
+    def add(self, value):
+        self.count += 1
+        if value is not None:
+            self.total += value
+            self.sketch.add(value)
+
+    def remove(self, value):
+        self.count -= 1
+        if value is not None:
+            self.total -= value
+            self.sketch.remove(value)
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+        return self
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'total': self.total,
+            'sketch': self.sketch.to_dict() if self.sketch is not None else None
+        }
+
+    @classmethod
+    def from_dict(cls, values):
+        aggregate = cls(with_sketch=False)
+        aggregate.count = values['count']
+        aggregate.total = values['total']
+        aggregate.sketch = QuantileSketch.from_dict(values['sketch']) if values['sketch'] is not None else None
+        return aggregate
+
+
+# def issue_flow_contributions() # THE WEEKLY METRIC VALUES A SINGLE ISSUE CONTRIBUTES
+def issue_flow_contributions(issue):
+    """
+    Work out which weekly aggregates an issue contributes to, using the same definitions as the notebooks.
+
+    Parameters:
+    issue (dict): Issue values keyed by the fields in FLOW_ISSUE_FIELDS.
+
+    Returns:
+    list: (week, issue type category, metric, value) tuples. Throughput metrics have a value of None.
+    """
+    contributions = []
+    category = issue.get('Issue Type Category')
+
+    for metric, week_field in FLOW_THROUGHPUT_METRICS.items():
+        week = issue.get(week_field)
+        if not pd.isna(week):
+            contributions.append((week, category, metric, None))
+
+    # Durations are only calculated for done tickets and are bucketed by the week they were resolved
+    resolution_week = issue.get('Resolution Week')
+    if pd.isna(issue.get('Done Date')) or pd.isna(resolution_week):
+        return contributions
+
+    for metric, (start_field, end_field) in FLOW_DURATION_METRICS.items():
+        start = issue.get(start_field)
+        end = issue.get(end_field)
+        if pd.isna(start) or pd.isna(end):
+            continue
+        duration = round((end - start).total_seconds() / (24 * 60 * 60), 2)
+        contributions.append((resolution_week, category, metric, duration))
+
+    return contributions
+
+
+# class FlowMetricsStore # MATERIALIZED WEEKLY FLOW METRIC AGGREGATES
+class FlowMetricsStore:
+    """
+    Weekly per-team, per-issue-type-category flow metric aggregates that are maintained incrementally.
+
+    Each issue's stage dates are remembered, so when an issue is seen again only the weeks its previous and new
+    dates touch are updated - everything else is left alone. Dashboards read the precomputed weeks instead of
+    recomputing lead time, cycle time, and throughput over the full extract.
+
+    Typical use from a notebook:
+        store = FlowMetricsStore.load("flow_metrics.json")
+        changed = fetch_jira_issues_to_dataframe(j, f"({query}) and updated >= -7d")
+        store.update_from_dataframe(changed, team=title)
+        store.save("flow_metrics.json")
+        weekly = store.weekly_metrics(team=title, start_week=start_date)
+    """
+
+    def __init__(self, relative_accuracy=DEFAULT_SKETCH_RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.issues = {}  # (team, issue key) -> {field: value} for FLOW_ISSUE_FIELDS
+        self.aggregates = {}  # (team, week, issue type category, metric) -> FlowAggregate
+
+    def _apply(self, team, contributions, remove=False):
+        for week, category, metric, value in contributions:
+            key = (team, week, category, metric)
+            if remove:
+                aggregate = self.aggregates.get(key)
+                if aggregate is None:
+                    continue
+                aggregate.remove(value)
+                if aggregate.count <= 0:
+                    del self.aggregates[key]
+            else:
+                aggregate = self.aggregates.get(key)
+                if aggregate is None:
+                    aggregate = FlowAggregate(with_sketch=metric in FLOW_DURATION_METRICS, relative_accuracy=self.relative_accuracy)
+                    self.aggregates[key] = aggregate
+                aggregate.add(value)
+
+    def update_issue(self, team, issue_key, issue):
+        """
+        Add or update a single issue, touching only the weeks its previous and new stage dates fall in.
+
+        Parameters:
+        team (str): Team the issue is reported under.
+        issue_key (str): Jira issue key.
+        issue (dict): Issue values keyed by the fields in FLOW_ISSUE_FIELDS.
+
+        Returns:
+        bool: True if any aggregates changed.
+        """
+        new_issue = {field: None if pd.isna(issue.get(field)) else issue.get(field) for field in FLOW_ISSUE_FIELDS}
+        for field in FLOW_DATE_FIELDS:
+            if new_issue[field] is not None:
+                new_issue[field] = pd.Timestamp(new_issue[field])
+
+        previous_issue = self.issues.get((team, issue_key))
+        if previous_issue == new_issue:
+            return False
+
+        previous = Counter(issue_flow_contributions(previous_issue) if previous_issue else [])
+        current = Counter(issue_flow_contributions(new_issue))
+
+        # Contributions that didn't change cancel out, so unchanged weeks are never touched
+        self._apply(team, (previous - current).elements(), remove=True)
+        self._apply(team, (current - previous).elements())
+
+        self.issues[(team, issue_key)] = new_issue
+        return True
+
+    def remove_issue(self, team, issue_key):
+        """Back an issue out of every week it contributed to."""
+        previous_issue = self.issues.pop((team, issue_key), None)
+        if previous_issue:
+            self._apply(team, issue_flow_contributions(previous_issue), remove=True)
+
+    def update_from_dataframe(self, df, team, remove_missing=False):
+        """
+        Apply every issue in a fetch_jira_issues_to_dataframe() result to the store.
+
+        Parameters:
+        df (pd.DataFrame): Issues to add or update.
+        team (str): Team the issues are reported under.
+        remove_missing (bool): Remove this team's stored issues that aren't in df. Only use with a full extract.
+
+        Returns:
+        int: Number of issues whose aggregates changed.
+        """
+        changed = 0
+        for issue in df[['Issue Key'] + FLOW_ISSUE_FIELDS].to_dict('records'):
+            if self.update_issue(team, issue['Issue Key'], issue):
+                changed += 1
+
+        if remove_missing:
+            current_keys = set(df['Issue Key'])
+            missing_keys = [issue_key for stored_team, issue_key in self.issues if stored_team == team and issue_key not in current_keys]
+            for issue_key in missing_keys:
+                self.remove_issue(team, issue_key)
+                changed += 1
+
+        return changed
+
+    def _matching_aggregates(self, team, issue_type_category, start_week, end_week):
+        start_week = pd.to_datetime(start_week) if start_week is not None else None
+        end_week = pd.to_datetime(end_week) if end_week is not None else None
+
+        for (agg_team, week, category, metric), aggregate in self.aggregates.items():
+            if team is not None and agg_team != team:
+                continue
+            if issue_type_category is not None and category != issue_type_category:
+                continue
+            if start_week is not None and week < start_week:
+                continue
+            if end_week is not None and week > end_week:
+                continue
+            yield agg_team, week, category, metric, aggregate
+
+    def weekly_metrics(self, team=None, issue_type_category=None, start_week=None, end_week=None, quantiles=(0.5, 0.85)):
+        """
+        Read the precomputed weekly aggregates as a DataFrame.
+
+        Parameters:
+        team (str): Only include this team. All teams when None.
+        issue_type_category (str): Only include this category (e.g. 'STANDARD'). All categories when None.
+        start_week, end_week: Inclusive week range. Unbounded when None.
+        quantiles (tuple): Quantiles to estimate for each duration metric.
+
+        Returns:
+        pd.DataFrame: One row per team / week / category with throughput counts and, for each duration metric,
+                      its count, mean, and approximate quantiles (e.g. 'Cycle Time (days) P85').
+        """
+        rows = {}
+        for agg_team, week, category, metric, aggregate in self._matching_aggregates(team, issue_type_category, start_week, end_week):
+            row = rows.setdefault((agg_team, week, category), {'Team': agg_team, 'Week': week, 'Issue Type Category': category})
+            if aggregate.sketch is None:
+                row[metric] = aggregate.count
+            else:
+                row.update(_duration_summary(metric, aggregate, quantiles))
+
+        columns = ['Team', 'Week', 'Issue Type Category'] + list(FLOW_THROUGHPUT_METRICS)
+        df = pd.DataFrame(list(rows.values()), columns=None if rows else columns)
+        count_columns = list(FLOW_THROUGHPUT_METRICS) + [f"{metric} Count" for metric in FLOW_DURATION_METRICS if f"{metric} Count" in df]
+        for column in count_columns:
+            df[column] = df[column].fillna(0).astype(int) if column in df else 0
+
+        return df.sort_values(['Team', 'Week', 'Issue Type Category']).reset_index(drop=True)
+
+    def summarize(self, team=None, issue_type_category=None, start_week=None, end_week=None, quantiles=(0.5, 0.85)):
+        """
+        Merge the weekly aggregates across a range into a single summary, without going back to the issues.
+
+        Parameters are the same as weekly_metrics().
+
+        Returns:
+        dict: Throughput totals plus count, mean, and approximate quantiles for each duration metric.
+        """
+        merged = {}
+        for _, _, _, metric, aggregate in self._matching_aggregates(team, issue_type_category, start_week, end_week):
+            if metric not in merged:
+                merged[metric] = FlowAggregate(with_sketch=aggregate.sketch is not None, relative_accuracy=self.relative_accuracy)
+            merged[metric].merge(aggregate)
+
+        summary = {metric: merged[metric].count if metric in merged else 0 for metric in FLOW_THROUGHPUT_METRICS}
+        for metric in FLOW_DURATION_METRICS:
+            if metric in merged:
+                summary.update(_duration_summary(metric, merged[metric], quantiles))
+
+        return summary
+
+    def save(self, path):
+        """Write the store to a JSON file."""
+        values = {
+            'relative_accuracy': self.relative_accuracy,
+            'issues': [
+                {'Team': team, 'Issue Key': issue_key, **{field: _to_json_value(value) for field, value in issue.items()}}
+                for (team, issue_key), issue in self.issues.items()
+            ],
+            'aggregates': [
+                {'Team': team, 'Week': _to_json_value(week), 'Issue Type Category': category, 'Metric': metric, **aggregate.to_dict()}
+                for (team, week, category, metric), aggregate in self.aggregates.items()
+            ]
+        }
+        with open(path, 'w') as f:
+            json.dump(values, f)
+
+    @classmethod
+    def load(cls, path):
+        """Read a store written by save(). Returns an empty store if the file doesn't exist yet."""
+        try:
+            with open(path) as f:
+                values = json.load(f)
+        except FileNotFoundError:
+            return cls()
+
+        store = cls(values['relative_accuracy'])
+        for issue in values['issues']:
+            store.issues[(issue['Team'], issue['Issue Key'])] = {
+                field: pd.Timestamp(issue[field]) if field in FLOW_DATE_FIELDS and issue[field] is not None else issue[field]
+                for field in FLOW_ISSUE_FIELDS
+            }
+        for aggregate in values['aggregates']:
+            key = (aggregate['Team'], pd.Timestamp(aggregate['Week']), aggregate['Issue Type Category'], aggregate['Metric'])
+            store.aggregates[key] = FlowAggregate.from_dict(aggregate)
+
+        return store
+
+
+def _duration_summary(metric, aggregate, quantiles):
+    summary = {
+        f"{metric} Count": aggregate.count,
+        f"{metric} Mean": round(aggregate.total / aggregate.count, 2) if aggregate.count else None
+    }
+    for q in quantiles:
+        value = aggregate.sketch.quantile(q)
+        summary[f"{metric} P{round(q * 100):g}"] = round(value, 2) if value is not None else None
+    return summary
+
+
+def _to_json_value(value):
+    return value.isoformat() if isinstance(value, pd.Timestamp) else value
@@ -4,8 +4,16 @@ from tqdm import tqdm
 import pandas as pd
 from datetime import *
 import time
+from concurrent.futures import ThreadPoolExecutor
 from jira_references import *
 
+# Parent lookup cache - persists across fetches for the life of the session.
+# Maps issue key -> (fetched_at, {'Summary', 'Issue Type', 'Parent'})
+PARENT_CACHE_TTL_SECONDS = 60 * 60
+PARENT_FETCH_BATCH_SIZE = 100
+PARENT_FETCH_MAX_WORKERS = 4
+_parent_cache = {}
+
 # Jira Connection
 def jira_connect(prompt_for_reconnect = False, existing_connection = None):
     needs_new_connection = False
@@ -55,6 +63,7 @@ def fetch_jira_issues_to_dataframe(jira_conn, jql_query):
     #  customfield_10009 = Parent Link
 
     data = []
+    hierarchy = {}
     for issue in tqdm(issues, desc="Processing issues"):
         
         issue_key = issue.key
@@ -232,6 +241,7 @@ def fetch_jira_issues_to_dataframe(jira_conn, jql_query):
         parent_theme = None
 
         parent = issue.fields.parent.key if hasattr(issue.fields, 'parent') else None
+        hierarchy[issue_key] = {'Summary': issue_summary, 'Issue Type': issue_type, 'Parent': parent}
         
         match issue_type_category:
             case "PLANNING":
@@ -286,32 +296,143 @@ def fetch_jira_issues_to_dataframe(jira_conn, jql_query):
 
     df = pd.DataFrame(data)
 
+    # Fill in any parents that fell outside of the JQL result set
+    hierarchy.update(resolve_missing_parents(jira_conn, hierarchy))
+
     # Second pass to populate the parent epic and parent initiative fields
     for i, row in df.iterrows():
         if row['Parent Initiative']:
-            parent_initiative_row = df[df['Issue Key'] == row['Parent Initiative']]
-            if not parent_initiative_row.empty:
-                df.at[i, 'Parent Initiative Name'] = parent_initiative_row['Summary'].values[0]
-                df.at[i, 'Parent Theme'] = parent_initiative_row['Parent Theme'].values[0]
+            parent_initiative_row = hierarchy.get(row['Parent Initiative'])
+            if parent_initiative_row:
+                df.at[i, 'Parent Initiative Name'] = parent_initiative_row['Summary']
+                df.at[i, 'Parent Theme'] = parent_initiative_row['Parent']
                 
     for i, row in df.iterrows():
         if row['Parent Epic']:
-            parent_epic_row = df[df['Issue Key'] == row['Parent Epic']]
-            if not parent_epic_row.empty:
-                df.at[i, 'Parent Epic Name'] = parent_epic_row['Summary'].values[0]
-                df.at[i, 'Parent Initiative'] = parent_epic_row['Parent Initiative'].values[0]
-                df.at[i, 'Parent Initiative Name'] = parent_epic_row['Parent Initiative Name'].values[0]
-                df.at[i, 'Parent Theme'] = parent_epic_row['Parent Theme'].values[0]
+            parent_epic_row = hierarchy.get(row['Parent Epic'])
+            if parent_epic_row:
+                df.at[i, 'Parent Epic Name'] = parent_epic_row['Summary']
+                parent_initiative = parent_epic_row['Parent']
+                df.at[i, 'Parent Initiative'] = parent_initiative
+                parent_initiative_row = hierarchy.get(parent_initiative)
+                if parent_initiative_row:
+                    df.at[i, 'Parent Initiative Name'] = parent_initiative_row['Summary']
+                    df.at[i, 'Parent Theme'] = parent_initiative_row['Parent']
 
     for i, row in df.iterrows():
         if row['Parent Story']:
-            parent_story_row = df[df['Issue Key'] == row['Parent Story']]
-            if not parent_story_row.empty:
-                df.at[i, 'Parent Story Name'] = parent_story_row['Summary'].values[0]
-                df.at[i, 'Parent Epic'] = parent_story_row['Parent Epic'].values[0]
-                df.at[i, 'Parent Epic Name'] = parent_story_row['Parent Epic Name'].values[0]
-                df.at[i, 'Parent Initiative'] = parent_story_row['Parent Initiative'].values[0]
-                df.at[i, 'Parent Initiative Name'] = parent_story_row['Parent Initiative Name'].values[0]
-                df.at[i, 'Parent Theme'] = parent_story_row['Parent Theme'].values[0]
-
-    return df
\ No newline at end of file
+            parent_story_row = hierarchy.get(row['Parent Story'])
+            if parent_story_row:
+                df.at[i, 'Parent Story Name'] = parent_story_row['Summary']
+                parent_epic = parent_story_row['Parent']
+                df.at[i, 'Parent Epic'] = parent_epic
+                parent_epic_row = hierarchy.get(parent_epic)
+                if parent_epic_row:
+                    df.at[i, 'Parent Epic Name'] = parent_epic_row['Summary']
+                    parent_initiative = parent_epic_row['Parent']
+                    df.at[i, 'Parent Initiative'] = parent_initiative
+                    parent_initiative_row = hierarchy.get(parent_initiative)
+                    if parent_initiative_row:
+                        df.at[i, 'Parent Initiative Name'] = parent_initiative_row['Summary']
+                        df.at[i, 'Parent Theme'] = parent_initiative_row['Parent']
+
+    return df
+
+
+# def resolve_missing_parents() # LOOK UP PARENTS THAT AREN'T IN THE RESULT SET
+def resolve_missing_parents(jira_conn, hierarchy):
+    """
+    Walk up the issue hierarchy one level at a time, fetching any parents that are not already known.
+
+    Each level's missing keys are fetched together in batched `key in (...)` queries so a filter that only
+    returns sub-tasks or stories still rolls up to its epics, initiatives, and themes. Themes are the top of
+    the hierarchy and testing issues sit outside of it, so only parents of sub-tasks, standard issues, and
+    epics are ever fetched.
+
+    Parameters:
+    jira_conn (JIRA): An authenticated JIRA connection object.
+    hierarchy (dict): Issue key -> {'Summary', 'Issue Type', 'Parent'} for the issues already in hand.
+
+    Returns:
+    dict: Issue key -> {'Summary', 'Issue Type', 'Parent'} for every parent that had to be looked up.
+    """
+    hierarchy_issue_types = SUB_TASK_ISSUE_TYPES + STANDARD_ISSUE_TYPES + EPIC_ISSUE_TYPES
+
+    resolved = {}
+    pending = {
+        values['Parent'] for values in hierarchy.values()
+        if values['Parent'] and values['Issue Type'] in hierarchy_issue_types
+    }
+
+    # Story -> Epic -> Initiative is as deep as the hierarchy goes below a Theme
+    for _ in range(3):
+        missing = {key for key in pending if key not in hierarchy and key not in resolved}
+        if not missing:
+            break
+
+        fetched = fetch_parent_issues(jira_conn, missing)
+        resolved.update(fetched)
+
+        pending = {
+            values['Parent'] for values in fetched.values()
+            if values['Parent'] and values['Issue Type'] in hierarchy_issue_types
+        }
+
+    return resolved
+
+
+# def fetch_parent_issues() # BATCH FETCH THE MINIMAL FIELDS NEEDED TO BUILD THE HIERARCHY
+def fetch_parent_issues(jira_conn, issue_keys, batch_size=PARENT_FETCH_BATCH_SIZE, max_workers=PARENT_FETCH_MAX_WORKERS):
+    """
+    Fetch summary, issue type, and parent for a set of issue keys, using the session parent cache where possible.
+
+    Parameters:
+    jira_conn (JIRA): An authenticated JIRA connection object.
+    issue_keys (iterable): Issue keys to look up.
+    batch_size (int): Maximum number of keys per `key in (...)` query.
+    max_workers (int): Number of batches to fetch concurrently.
+
+    Returns:
+    dict: Issue key -> {'Summary', 'Issue Type', 'Parent'} for every key that could be found.
+    """
+    now = time.time()
+
+    # Evict anything that has aged out before reading from the cache
+    expired_keys = [key for key, (fetched_at, _) in _parent_cache.items() if now - fetched_at > PARENT_CACHE_TTL_SECONDS]
+    for key in expired_keys:
+        del _parent_cache[key]
+
+    results = {}
+    keys_to_fetch = []
+    for key in sorted(set(issue_keys)):
+        if key in _parent_cache:
+            results[key] = _parent_cache[key][1]
+        else:
+            keys_to_fetch.append(key)
+
+    if not keys_to_fetch:
+        return results
+
+    batches = [keys_to_fetch[i:i + batch_size] for i in range(0, len(keys_to_fetch), batch_size)]
+
+    def fetch_batch(batch):
+        jql_query = f"key in ({','.join(batch)})"
+        try:
+            # validate_query=False so a deleted or restricted key doesn't fail the whole batch
+            return jira_conn.search_issues(jql_query, maxResults=False, fields="summary,issuetype,parent", validate_query=False)
+        except Exception as e:
+            print(f"Unable to fetch parent issues {batch[0]}..{batch[-1]}: {e}")
+            return []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for issues in tqdm(executor.map(fetch_batch, batches), total=len(batches), desc="Fetching parent issues"):
+            for issue in issues:
+                values = {
+                    'Summary': issue.fields.summary,
+                    'Issue Type': issue.fields.issuetype.name,
+                    'Parent': issue.fields.parent.key if hasattr(issue.fields, 'parent') else None
+                }
+                _parent_cache[issue.key] = (now, values)
+                results[issue.key] = values
+
+    return results